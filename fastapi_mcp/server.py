@@ -124,6 +124,8 @@ class FastApiMCP:
         self.setup_server()
 
     def setup_server(self) -> None:
+        # Build the schema from the current routes instead of app.openapi(), which memoizes its result
+        # and would hide endpoints added after the first call from a later setup_server() refresh.
         openapi_schema = get_openapi(
             title=self.fastapi.title,
             version=self.fastapi.version,
@@ -340,8 +342,7 @@ class FastApiMCP:
         # Normalize mount path
         if not mount_path.startswith("/"):
             mount_path = f"/{mount_path}"
-        if mount_path.endswith("/"):
-            mount_path = mount_path[:-1]
+        mount_path = mount_path.rstrip("/")
 
         if not router:
             router = self.fastapi
@@ -396,8 +397,7 @@ class FastApiMCP:
         # Normalize mount path
         if not mount_path.startswith("/"):
             mount_path = f"/{mount_path}"
-        if mount_path.endswith("/"):
-            mount_path = mount_path[:-1]
+        mount_path = mount_path.rstrip("/")
 
         if not router:
             router = self.fastapi
@@ -1,8 +1,11 @@
-from typing import Optional, List, Any
+from functools import lru_cache
+from typing import Optional, List, Any, Callable
 
 from fastapi import FastAPI, Query, Path, Body, HTTPException
 import pytest
 
+from fastapi_mcp import FastApiMCP
+
 from tests.fixtures.conftest import make_fastapi_app_base
 
 from .types import Item
@@ -72,3 +75,30 @@ def simple_fastapi_app() -> FastAPI:
 @pytest.fixture
 def simple_fastapi_app_with_root_path() -> FastAPI:
     return make_simple_fastapi_app(parametrized_config={"root_path": "/api/v1"})
+
+
+@pytest.fixture(scope="session")
+def shared_simple_fastapi_app() -> FastAPI:
+    """
+    A single simple app for the whole session, for tests that only read it.
+    Tests that add routes or mount an MCP server must use `simple_fastapi_app` instead.
+    """
+    return make_simple_fastapi_app()
+
+
+@pytest.fixture(scope="session")
+def simple_mcp_factory(shared_simple_fastapi_app: FastAPI) -> Callable[..., FastApiMCP]:
+    """
+    Build read-only MCP servers for the simple app, reusing one instance per configuration for the whole session.
+    Tests that mount the server or otherwise mutate it must construct their own instead.
+    """
+
+    @lru_cache(maxsize=None)
+    def factory(describe_all_responses: bool = False, describe_full_response_schema: bool = False) -> FastApiMCP:
+        return FastApiMCP(
+            shared_simple_fastapi_app,
+            describe_all_responses=describe_all_responses,
+            describe_full_response_schema=describe_full_response_schema,
+        )
+
+    return factory
@@ -64,3 +64,44 @@ def test_normalize_paths(simple_fastapi_app: FastAPI):
     # Check that the route was added with a normalized path
     route_found = any("/test-mcp2" in str(route) for route in simple_fastapi_app.routes)
     assert route_found, "Normalized mount path not found in app routes"
+
+    # Test with repeated trailing slashes
+    mcp3 = FastApiMCP(simple_fastapi_app)
+    mcp3.mount_sse(mount_path="/test-mcp3//")
+    mcp3.mount_http(mount_path="/test-mcp4//")
+
+    # Check that all trailing slashes were stripped
+    route_paths = {getattr(route, "path", None) for route in simple_fastapi_app.routes}
+    assert {"/test-mcp3", "/test-mcp3/messages/", "/test-mcp4"} <= route_paths, (
+        "Mount paths with repeated trailing slashes were not normalized"
+    )
+
+
+def test_setup_server_ignores_cached_openapi_schema(simple_fastapi_app: FastAPI):
+    """Test that tools are generated from the current routes, not a previously cached OpenAPI schema."""
+    simple_fastapi_app.openapi_schema = simple_fastapi_app.openapi()
+
+    @simple_fastapi_app.get("/new/endpoint/", operation_id="new_endpoint")
+    async def new_endpoint():
+        return {"message": "Hello, world!"}
+
+    mcp = FastApiMCP(simple_fastapi_app)
+
+    assert "new_endpoint" in mcp.operation_map
+    assert "new_endpoint" in {tool.name for tool in mcp.tools}
+
+
+def test_setup_server_exposes_routes_added_after_creation(simple_fastapi_app: FastAPI):
+    """Test that endpoints added after creation are only exposed once the server is set up again."""
+    mcp = FastApiMCP(simple_fastapi_app)
+
+    @simple_fastapi_app.get("/new/endpoint/", operation_id="new_endpoint")
+    async def new_endpoint():
+        return {"message": "Hello, world!"}
+
+    assert "new_endpoint" not in {tool.name for tool in mcp.tools}
+    assert "new_endpoint" not in mcp.operation_map
+
+    mcp.setup_server()
+    assert "new_endpoint" in {tool.name for tool in mcp.tools}
+    assert "new_endpoint" in mcp.operation_map
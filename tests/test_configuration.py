@@ -1,177 +1,135 @@
+import re
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
 from fastapi import FastAPI
 import pytest
 
 from fastapi_mcp import FastApiMCP
 
 
-def test_default_configuration(simple_fastapi_app: FastAPI):
-    """Test the default configuration of FastApiMCP."""
-    # Create MCP server with defaults
-    mcp_server = FastApiMCP(simple_fastapi_app)
-
-    # Check default name and description
-    assert mcp_server.name == simple_fastapi_app.title
-    assert mcp_server.description == simple_fastapi_app.description
-
-    # Check default options
-    assert mcp_server._describe_all_responses is False
-    assert mcp_server._describe_full_response_schema is False
-
-
-def test_custom_configuration(simple_fastapi_app: FastAPI):
-    """Test a custom configuration of FastApiMCP."""
-    # Create MCP server with custom options
-    custom_name = "Custom MCP Server"
-    custom_description = "A custom MCP server for testing"
-
-    mcp_server = FastApiMCP(
-        simple_fastapi_app,
-        name=custom_name,
-        description=custom_description,
-        describe_all_responses=True,
-        describe_full_response_schema=True,
-    )
-
-    # Check custom name and description
-    assert mcp_server.name == custom_name
-    assert mcp_server.description == custom_description
-
-    # Check custom options
-    assert mcp_server._describe_all_responses is True
-    assert mcp_server._describe_full_response_schema is True
-
-
-def test_describe_all_responses_config_simple_app(simple_fastapi_app: FastAPI):
-    """Test the describe_all_responses behavior with the simple app."""
-    mcp_default = FastApiMCP(
-        simple_fastapi_app,
-    )
-
-    mcp_all_responses = FastApiMCP(
-        simple_fastapi_app,
-        describe_all_responses=True,
-    )
-
-    for tool in mcp_default.tools:
-        assert tool.description is not None
-        if tool.name == "raise_error":
-            pass
-        elif tool.name != "delete_item":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**Example Response:**") == 1, (
-                "The description should only contain one example response"
-            )
-            assert tool.description.count("**Output Schema:**") == 0, (
-                "The description should not contain a full output schema"
-            )
-        else:
-            # The delete endpoint in the Items API returns a 204 status code
-            assert tool.description.count("**200**") == 0, "The description should not contain a 200 status code"
-            assert tool.description.count("**204**") == 1, "The description should contain a 204 status code"
-            # The delete endpoint in the Items API returns a 204 status code and has no response body
-            assert tool.description.count("**Example Response:**") == 0, (
-                "The description should not contain any example responses"
-            )
-            assert tool.description.count("**Output Schema:**") == 0, (
-                "The description should not contain a full output schema"
-            )
-
-    for tool in mcp_all_responses.tools:
-        assert tool.description is not None
-        if tool.name == "raise_error":
-            pass
-        elif tool.name != "delete_item":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
-            assert tool.description.count("**Example Response:**") == 2, (
-                "The description should contain two example responses"
-            )
-            assert tool.description.count("**Output Schema:**") == 0, (
-                "The description should not contain a full output schema"
-            )
-        else:
-            assert tool.description.count("**204**") == 1, "The description should contain a 204 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
-            # The delete endpoint in the Items API returns a 204 status code and has no response body
-            # But FastAPI's default 422 response should be present
-            # So just 1 instance of Example Response should be present
-            assert tool.description.count("**Example Response:**") == 1, (
-                "The description should contain one example response"
-            )
-            assert tool.description.count("**Output Schema:**") == 0, (
-                "The description should not contain any output schema"
-            )
-
-
-def test_describe_full_response_schema_config_simple_app(simple_fastapi_app: FastAPI):
-    """Test the describe_full_response_schema behavior with the simple app."""
-
-    mcp_full_response_schema = FastApiMCP(
-        simple_fastapi_app,
-        describe_full_response_schema=True,
-    )
-
-    for tool in mcp_full_response_schema.tools:
-        assert tool.description is not None
-        if tool.name == "raise_error":
-            pass
-        elif tool.name != "delete_item":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**Example Response:**") == 1, (
-                "The description should only contain one example response"
-            )
-            assert tool.description.count("**Output Schema:**") == 1, (
-                "The description should contain one full output schema"
-            )
-        else:
-            # The delete endpoint in the Items API returns a 204 status code
-            assert tool.description.count("**200**") == 0, "The description should not contain a 200 status code"
-            assert tool.description.count("**204**") == 1, "The description should contain a 204 status code"
-            # The delete endpoint in the Items API returns a 204 status code and has no response body
-            assert tool.description.count("**Example Response:**") == 0, (
-                "The description should not contain any example responses"
-            )
-            assert tool.description.count("**Output Schema:**") == 0, (
-                "The description should not contain a full output schema"
-            )
-
-
-def test_describe_all_responses_and_full_response_schema_config_simple_app(simple_fastapi_app: FastAPI):
-    """Test the describe_all_responses and describe_full_response_schema params together with the simple app."""
-
-    mcp_all_responses_and_full_response_schema = FastApiMCP(
-        simple_fastapi_app,
-        describe_all_responses=True,
-        describe_full_response_schema=True,
-    )
-
-    for tool in mcp_all_responses_and_full_response_schema.tools:
-        assert tool.description is not None
-        if tool.name == "raise_error":
-            pass
-        elif tool.name != "delete_item":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
-            assert tool.description.count("**Example Response:**") == 2, (
-                "The description should contain two example responses"
-            )
-            assert tool.description.count("**Output Schema:**") == 2, (
-                "The description should contain two full output schemas"
-            )
-        else:
-            # The delete endpoint in the Items API returns a 204 status code
-            assert tool.description.count("**200**") == 0, "The description should not contain a 200 status code"
-            assert tool.description.count("**204**") == 1, "The description should contain a 204 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
-            # The delete endpoint in the Items API returns a 204 status code and has no response body
-            # But FastAPI's default 422 response should be present
-            # So just 1 instance of Example Response and Output Schema should be present
-            assert tool.description.count("**Example Response:**") == 1, (
-                "The description should contain one example response"
-            )
-            assert tool.description.count("**Output Schema:**") == 1, (
-                "The description should contain one full output schema"
-            )
+_DESCRIPTION_MARKERS = ("200", "204", "422", "Example Response:", "Output Schema:")
+_DESCRIPTION_MARKER_PATTERN = re.compile(r"\*\*(" + "|".join(map(re.escape, _DESCRIPTION_MARKERS)) + r")\*\*")
+
+
+def _count_markers(description: str) -> dict[str, int]:
+    """Count the status code and section markers of a tool description in a single pass."""
+    counts = dict.fromkeys(_DESCRIPTION_MARKERS, 0)
+    for match in _DESCRIPTION_MARKER_PATTERN.finditer(description):
+        counts[match.group(1)] += 1
+    return counts
+
+
+# Expected marker counts in the simple app's tool descriptions, keyed by
+# (describe_all_responses, describe_full_response_schema)
+_SIMPLE_APP_EXPECTED_MARKERS: Mapping[tuple[bool, bool], Mapping[str, Mapping[str, int]]] = MappingProxyType(
+    {
+        (False, False): MappingProxyType(
+            {
+                "other": MappingProxyType({"200": 1, "204": 0, "422": 0, "Example Response:": 1, "Output Schema:": 0}),
+                # The delete endpoint in the Items API returns a 204 status code and has no response body
+                "delete_item": MappingProxyType(
+                    {"200": 0, "204": 1, "422": 0, "Example Response:": 0, "Output Schema:": 0}
+                ),
+            }
+        ),
+        (True, False): MappingProxyType(
+            {
+                "other": MappingProxyType({"200": 1, "204": 0, "422": 1, "Example Response:": 2, "Output Schema:": 0}),
+                # FastAPI's default 422 response is the only one with an example for the delete endpoint
+                "delete_item": MappingProxyType(
+                    {"200": 0, "204": 1, "422": 1, "Example Response:": 1, "Output Schema:": 0}
+                ),
+            }
+        ),
+        (False, True): MappingProxyType(
+            {
+                "other": MappingProxyType({"200": 1, "204": 0, "422": 0, "Example Response:": 1, "Output Schema:": 1}),
+                "delete_item": MappingProxyType(
+                    {"200": 0, "204": 1, "422": 0, "Example Response:": 0, "Output Schema:": 0}
+                ),
+            }
+        ),
+        (True, True): MappingProxyType(
+            {
+                "other": MappingProxyType({"200": 1, "204": 0, "422": 1, "Example Response:": 2, "Output Schema:": 2}),
+                "delete_item": MappingProxyType(
+                    {"200": 0, "204": 1, "422": 1, "Example Response:": 1, "Output Schema:": 1}
+                ),
+            }
+        ),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        pytest.param(
+            {},
+            {
+                "name": None,
+                "description": None,
+                "describe_all_responses": False,
+                "describe_full_response_schema": False,
+            },
+            id="default",
+        ),
+        pytest.param(
+            {
+                "name": "Custom MCP Server",
+                "description": "A custom MCP server for testing",
+                "describe_all_responses": True,
+                "describe_full_response_schema": True,
+            },
+            {
+                "name": "Custom MCP Server",
+                "description": "A custom MCP server for testing",
+                "describe_all_responses": True,
+                "describe_full_response_schema": True,
+            },
+            id="custom",
+        ),
+    ],
+)
+def test_configuration(shared_simple_fastapi_app: FastAPI, kwargs: dict[str, Any], expected: dict[str, Any]):
+    """Test the default and a custom configuration of FastApiMCP."""
+    mcp_server = FastApiMCP(shared_simple_fastapi_app, **kwargs)
+
+    # Name and description fall back to the app's title and description
+    assert mcp_server.name == (expected["name"] or shared_simple_fastapi_app.title)
+    assert mcp_server.description == (expected["description"] or shared_simple_fastapi_app.description)
+
+    assert mcp_server._describe_all_responses is expected["describe_all_responses"]
+    assert mcp_server._describe_full_response_schema is expected["describe_full_response_schema"]
+
+
+@pytest.mark.parametrize(
+    "describe_all_responses, describe_full_response_schema",
+    [
+        pytest.param(False, False, id="default"),
+        pytest.param(True, False, id="all_responses"),
+        pytest.param(False, True, id="full_response_schema"),
+        pytest.param(True, True, id="all_responses_and_full_response_schema"),
+    ],
+)
+def test_describe_config_simple_app(
+    simple_mcp_factory: Callable[..., FastApiMCP],
+    describe_all_responses: bool,
+    describe_full_response_schema: bool,
+):
+    """Test the describe_all_responses and describe_full_response_schema behavior with the simple app."""
+    mcp_server = simple_mcp_factory(describe_all_responses, describe_full_response_schema)
+    expected = _SIMPLE_APP_EXPECTED_MARKERS[(describe_all_responses, describe_full_response_schema)]
+
+    descriptions = {tool.name: tool.description for tool in mcp_server.tools if tool.name != "raise_error"}
+    assert "delete_item" in descriptions
+
+    for name, description in descriptions.items():
+        assert description is not None
+        assert _count_markers(description) == expected["delete_item" if name == "delete_item" else "other"], (
+            f"Unexpected markers in the {name} description"
+        )
 
 
 def test_describe_all_responses_config_complex_app(complex_fastapi_app: FastAPI):
@@ -187,61 +145,61 @@ def test_describe_all_responses_config_complex_app(complex_fastapi_app: FastAPI)
 
     # Test default behavior (only success responses)
     for tool in mcp_default.tools:
-        assert tool.description is not None
+        description = tool.description
+        assert description is not None
 
         # Check get_product which has a 200 response and 404 error response defined
         if tool.name == "get_product":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 0, "The description should not contain a 404 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert "**404**" not in description, "The description should not contain a 404 status code"
             # Some endpoints might not have example responses if they couldn't be generated
             # Only verify no error responses are included
 
         # Check create_order which has 201, 400, 404, and 422 responses defined
         elif tool.name == "create_order":
-            assert tool.description.count("**201**") == 1, "The description should contain a 201 status code"
-            assert tool.description.count("**400**") == 0, "The description should not contain a 400 status code"
-            assert tool.description.count("**404**") == 0, "The description should not contain a 404 status code"
-            assert tool.description.count("**422**") == 0, "The description should not contain a 422 status code"
+            assert description.count("**201**") == 1, "The description should contain a 201 status code"
+            assert "**400**" not in description, "The description should not contain a 400 status code"
+            assert "**404**" not in description, "The description should not contain a 404 status code"
+            assert "**422**" not in description, "The description should not contain a 422 status code"
             # Some endpoints might not have example responses if they couldn't be generated
 
         # Check get_customer which has 200, 404, and 403 responses defined
         elif tool.name == "get_customer":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 0, "The description should not contain a 404 status code"
-            assert tool.description.count("**403**") == 0, "The description should not contain a 403 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert "**404**" not in description, "The description should not contain a 404 status code"
+            assert "**403**" not in description, "The description should not contain a 403 status code"
             # Based on the error message, this endpoint doesn't have example responses in the description
-            assert tool.description.count("**Example Response:**") == 0, (
+            assert "**Example Response:**" not in description, (
                 "This endpoint doesn't appear to have example responses in the default configuration"
             )
-            assert tool.description.count("**Output Schema:**") == 0, (
-                "The description should not contain a full output schema"
-            )
+            assert "**Output Schema:**" not in description, "The description should not contain a full output schema"
 
     # Test with describe_all_responses=True (should include error responses)
     for tool in mcp_all_responses.tools:
-        assert tool.description is not None
+        description = tool.description
+        assert description is not None
 
         # Check get_product which has a 200 response and 404 error response defined
         if tool.name == "get_product":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 1, "The description should contain a 404 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert description.count("**404**") == 1, "The description should contain a 404 status code"
+            assert description.count("**422**") == 1, "The description should contain a 422 status code"
             # Don't check exact count as implementations may vary, just ensure there are examples
 
         # Check create_order which has 201, 400, 404, and 422 responses defined
         elif tool.name == "create_order":
-            assert tool.description.count("**201**") == 1, "The description should contain a 201 status code"
-            assert tool.description.count("**400**") == 1, "The description should contain a 400 status code"
-            assert tool.description.count("**404**") == 1, "The description should contain a 404 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
+            assert description.count("**201**") == 1, "The description should contain a 201 status code"
+            assert description.count("**400**") == 1, "The description should contain a 400 status code"
+            assert description.count("**404**") == 1, "The description should contain a 404 status code"
+            assert description.count("**422**") == 1, "The description should contain a 422 status code"
             # Don't check exact count as implementations may vary, just ensure there are examples
 
         # Check get_customer which has 200, 404, and 403 responses defined
         elif tool.name == "get_customer":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 1, "The description should contain a 404 status code"
-            assert tool.description.count("**403**") == 1, "The description should contain a 403 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert description.count("**404**") == 1, "The description should contain a 404 status code"
+            assert description.count("**403**") == 1, "The description should contain a 403 status code"
+            assert description.count("**422**") == 1, "The description should contain a 422 status code"
             # Based on error messages, we need to check actual implementation behavior
 
 
@@ -253,38 +211,37 @@ def test_describe_full_response_schema_config_complex_app(complex_fastapi_app: F
     )
 
     for tool in mcp_full_response_schema.tools:
-        assert tool.description is not None
+        description = tool.description
+        assert description is not None
 
         # Check get_product which has a 200 response and 404 error response defined
         if tool.name == "get_product":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 0, "The description should not contain a 404 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert "**404**" not in description, "The description should not contain a 404 status code"
             # Only verify the success response schema is present
-            assert tool.description.count("**Output Schema:**") >= 1, (
+            assert description.count("**Output Schema:**") >= 1, (
                 "The description should contain at least one full output schema"
             )
 
         # Check create_order which has 201, 400, 404, and 422 responses defined
         elif tool.name == "create_order":
-            assert tool.description.count("**201**") == 1, "The description should contain a 201 status code"
-            assert tool.description.count("**400**") == 0, "The description should not contain a 400 status code"
-            assert tool.description.count("**404**") == 0, "The description should not contain a 404 status code"
-            assert tool.description.count("**422**") == 0, "The description should not contain a 422 status code"
+            assert description.count("**201**") == 1, "The description should contain a 201 status code"
+            assert "**400**" not in description, "The description should not contain a 400 status code"
+            assert "**404**" not in description, "The description should not contain a 404 status code"
+            assert "**422**" not in description, "The description should not contain a 422 status code"
             # Only verify the success response schema is present
-            assert tool.description.count("**Output Schema:**") >= 1, (
+            assert description.count("**Output Schema:**") >= 1, (
                 "The description should contain at least one full output schema"
             )
 
         # Check get_customer which has 200, 404, and 403 responses defined
         elif tool.name == "get_customer":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 0, "The description should not contain a 404 status code"
-            assert tool.description.count("**403**") == 0, "The description should not contain a 403 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert "**404**" not in description, "The description should not contain a 404 status code"
+            assert "**403**" not in description, "The description should not contain a 403 status code"
             # Based on error message, there are no example responses but there is an output schema
-            assert tool.description.count("**Example Response:**") == 0, (
-                "This endpoint doesn't appear to have example responses"
-            )
-            assert tool.description.count("**Output Schema:**") >= 1, (
+            assert "**Example Response:**" not in description, "This endpoint doesn't appear to have example responses"
+            assert description.count("**Output Schema:**") >= 1, (
                 "The description should contain at least one full output schema"
             )
 
@@ -298,49 +255,40 @@ def test_describe_all_responses_and_full_response_schema_config_complex_app(comp
     )
 
     for tool in mcp_all_responses_and_full_schema.tools:
-        assert tool.description is not None
+        description = tool.description
+        assert description is not None
 
         # Check get_product which has a 200 response and 404 error response defined
         if tool.name == "get_product":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 1, "The description should contain a 404 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert description.count("**404**") == 1, "The description should contain a 404 status code"
+            assert description.count("**422**") == 1, "The description should contain a 422 status code"
             # Based on the error message data, adjust the expected counts
             # Don't check exact counts, just ensure they exist
-            assert tool.description.count("**Example Response:**") > 0, (
-                "The description should contain example responses"
-            )
-            assert tool.description.count("**Output Schema:**") > 0, (
-                "The description should contain full output schemas"
-            )
+            assert description.count("**Example Response:**") > 0, "The description should contain example responses"
+            assert description.count("**Output Schema:**") > 0, "The description should contain full output schemas"
 
         # Check create_order which has 201, 400, 404, and 422 responses defined
         elif tool.name == "create_order":
-            assert tool.description.count("**201**") == 1, "The description should contain a 201 status code"
-            assert tool.description.count("**400**") == 1, "The description should contain a 400 status code"
-            assert tool.description.count("**404**") == 1, "The description should contain a 404 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
+            assert description.count("**201**") == 1, "The description should contain a 201 status code"
+            assert description.count("**400**") == 1, "The description should contain a 400 status code"
+            assert description.count("**404**") == 1, "The description should contain a 404 status code"
+            assert description.count("**422**") == 1, "The description should contain a 422 status code"
             # Don't check exact counts, just ensure they exist
-            assert tool.description.count("**Example Response:**") > 0, (
-                "The description should contain example responses"
-            )
-            assert tool.description.count("**Output Schema:**") > 0, (
-                "The description should contain full output schemas"
-            )
+            assert description.count("**Example Response:**") > 0, "The description should contain example responses"
+            assert description.count("**Output Schema:**") > 0, "The description should contain full output schemas"
 
         # Check get_customer which has 200, 404, and 403 responses defined
         elif tool.name == "get_customer":
-            assert tool.description.count("**200**") == 1, "The description should contain a 200 status code"
-            assert tool.description.count("**404**") == 1, "The description should contain a 404 status code"
-            assert tool.description.count("**403**") == 1, "The description should contain a 403 status code"
-            assert tool.description.count("**422**") == 1, "The description should contain a 422 status code"
+            assert description.count("**200**") == 1, "The description should contain a 200 status code"
+            assert description.count("**404**") == 1, "The description should contain a 404 status code"
+            assert description.count("**403**") == 1, "The description should contain a 403 status code"
+            assert description.count("**422**") == 1, "The description should contain a 422 status code"
             # From error message, we know there are exactly 3 example responses for this endpoint
-            assert tool.description.count("**Example Response:**") == 3, (
+            assert description.count("**Example Response:**") == 3, (
                 "The description should contain exactly three example responses"
             )
-            assert tool.description.count("**Output Schema:**") > 0, (
-                "The description should contain full output schemas"
-            )
+            assert description.count("**Output Schema:**") > 0, "The description should contain full output schemas"
 
 
 def test_filtering_functionality():